@@ -1,6 +1,6 @@
-from thumbnail_generator import ThumbnailGenerator
+from thumbnail_generator import ThumbnailGenerator, _LEAD_NUM_RE
 from pathlib import Path
-import re
+import sys
 
 def generate_from_file():
     """Generate thumbnails from course names in a text file"""
@@ -18,14 +18,8 @@ def generate_from_file():
             return
         
         with open(courses_file, 'r', encoding='utf-8') as file:
-            file_content = file.read()
-        
-        course_topics = []
-        for line in file_content.split('\n'):
-            if line.strip():
-                # Remove numbers at the beginning of each line
-                cleaned_line = re.sub(r'^\d+\s*', '', line.strip())
-                course_topics.append(cleaned_line)
+            # Remove numbers at the beginning of each non-empty line
+            course_topics = [_LEAD_NUM_RE.sub('', line.strip()) for line in file if line.strip()]
         
         if not course_topics:
             print(f"❌ No course names found in '{courses_file}'")
@@ -39,23 +33,26 @@ def generate_from_file():
         print('\n🚀 Starting thumbnail generation...\n')
         
         # Generate thumbnails with professional styling
-        results = generator.generate_multiple_thumbnails(course_topics, {
-            "aspect_ratio": "16x9"
-        })
+        with generator:
+            results = generator.generate_multiple_thumbnails(course_topics, {
+                "aspect_ratio": "16x9",
+                # --force regenerates thumbnails that already exist on disk
+                "overwrite": '--force' in sys.argv[1:]
+            })
         
         print('\n📊 Results Summary:')
         success_count = 0
         failure_count = 0
         
         for index, result in enumerate(results, 1):
-            if result['success']:
+            if result.success:
                 success_count += 1
-                print(f"✅ {index}. {result['topic']}")
-                print(f"   📁 Saved to: {result['file_path']}")
+                print(f"✅ {index}. {result.topic}")
+                print(f"   📁 Saved to: {result.file_path}")
             else:
                 failure_count += 1
-                print(f"❌ {index}. {result['topic']}")
-                print(f"   💥 Error: {result['error']}")
+                print(f"❌ {index}. {result.topic}")
+                print(f"   💥 Error: {result.error}")
             print('')  # Empty line for readability
         
         print(f"\n🎯 Summary: {success_count} successful, {failure_count} failed")
@@ -1,62 +1,45 @@
 import os
+import sys
+import json
+import logging
+import hashlib
+import shutil
+import uuid
+import zlib
+import functools
+from dataclasses import dataclass
+from typing import Optional
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import re
 from pathlib import Path
 from dotenv import load_dotenv
 import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Load environment variables
 load_dotenv()
 
-class ThumbnailGenerator:
-    def __init__(self):
-        self.api_key = os.getenv('IDEOGRAM_API_KEY')
-        self.output_dir = os.getenv('OUTPUT_DIR', './thumbnails')
-        
-        if not self.api_key:
-            raise ValueError('IDEOGRAM_API_KEY is required. Please set it in your .env file.')
-        
-        self.ensure_output_dir()
-    
-    def ensure_output_dir(self):
-        """Ensure the output directory exists"""
-        try:
-            Path(self.output_dir).mkdir(parents=True, exist_ok=True)
-            print(f"Output directory ensured: {self.output_dir}")
-        except Exception as error:
-            print(f"Error creating output directory: {error}")
-    
-    def generate_hook_text(self, topic: str) -> str:
-        """Create a short 2-4 word hook from the topic; uppercase for strong impact"""
-        text = topic
-        # Remove common words and numbers
-        text = re.sub(
-            r'\b(introduction to|intro to|fundamentals|basics|beginner|complete|masterclass|course|101|the|a|an|and|or|but|in|on|at|to|for|of|with|by)\b',
-            '',
-            text,
-            flags=re.IGNORECASE
-        )
-        # Remove any numbers at the beginning
-        text = re.sub(r'^\d+\s*', '', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-        if not text:
-            text = topic
-        words = text.split()
-        if len(words) <= 2:
-            hook = f"Master {text}".strip()
-        else:
-            hook = ' '.join(words[:3])
-        return hook.upper()
-    
-    def generate_prompt(self, topic, hook_text):
-        """Create a clean thumbnail prompt with variety"""
-        import random
-        
-        # Different style variations
-        style_variations = [
-            f"""
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.StreamHandler(sys.stdout))
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+_FILLER_RE = re.compile(
+    r'\b(introduction to|intro to|fundamentals|basics|beginner|complete|masterclass|course|101|the|a|an|and|or|but|in|on|at|to|for|of|with|by)\b',
+    re.IGNORECASE
+)
+_WS_RE = re.compile(r'\s+')
+_LEAD_NUM_RE = re.compile(r'^\d+\s*')
+_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9\s-]')
+
+# Prompt style variants, filled in with str.format(topic=..., hook_text=...)
+TEMPLATE_A = """
 Design a YouTube-style thumbnail for "{topic}" with ONLY two elements:
-1) the EXACT hook text: "{hook_text}"
+1) the EXACT hook text, and no other text: "{hook_text}"
 2) a professional person portrait (waist-up or headshot)
 
 Composition and style:
@@ -67,20 +50,15 @@ Composition and style:
 - Big typography; subtle outline/shadow for readability
 - Modern, premium, energetic look without clutter
 
-Strict constraints:
-- Render ONLY this text: "{hook_text}"
-- Absolutely NO logos, icons, symbols, or badges of any kind
-- NO timestamps, watermarks, corner tags, or UI elements
-- NO small or fake text anywhere
-
 Content rules:
 - One person (max two); business-casual attire; confident expression
 - Keep layout uncluttered; emphasize text and person only
 - Use strong contrast to make the text pop
-""",
-            f"""
+"""
+
+TEMPLATE_B = """
 Create a professional course thumbnail for "{topic}" featuring:
-1) the EXACT hook text: "{hook_text}"
+1) the EXACT hook text, and no other text: "{hook_text}"
 2) a confident business professional (headshot or waist-up)
 
 Design elements:
@@ -90,17 +68,12 @@ Design elements:
 - Professional attire and confident body language
 - High contrast for readability
 
-Constraints:
-- Render ONLY this text: "{hook_text}"
-- NO logos, icons, or decorative elements
-- NO watermarks or timestamps
-- Clean, uncluttered design
-
 Style: Corporate, professional, trustworthy
-""",
-            f"""
+"""
+
+TEMPLATE_C = """
 Design an engaging thumbnail for "{topic}" with:
-1) the EXACT hook text: "{hook_text}"
+1) the EXACT hook text, and no other text: "{hook_text}"
 2) a dynamic professional portrait
 
 Visual style:
@@ -110,17 +83,241 @@ Visual style:
 - Clean composition with strong visual hierarchy
 - Professional color palette with accent colors
 
-Requirements:
-- Render ONLY this text: "{hook_text}"
-- NO additional text, logos, or decorative elements
-- NO watermarks or timestamps
-- Professional, trustworthy appearance
-
 Focus: Clear communication of the course topic through text and professional imagery
 """
-        ]
+
+_PROMPT_TEMPLATES = (TEMPLATE_A, TEMPLATE_B, TEMPLATE_C)
+
+# Everything the thumbnail must not contain; sent once as the API's
+# negative_prompt rather than repeated in every positive prompt
+_NEGATIVE = (
+    "logos, company logos, YouTube logo, Google logo, "
+    "Microsoft logo, Apple logo, Meta logo, LinkedIn logo, Twitter logo, "
+    "social media icons, icons, symbols, badges, decorative elements, "
+    "timestamps, watermarks, corner tags, UI elements, overlays, "
+    "additional text, small text, fake text"
+)
+
+# Bump whenever generate_prompt changes so cached thumbnails are regenerated
+PROMPT_VERSION = 3
+CACHE_MANIFEST = ".cache.json"
+CACHE_MAX_AGE = 604800  # one week, in seconds
+
+DEFAULT_ASPECT_RATIO = "16x9"
+
+IDEOGRAM_GENERATE_URL = "https://api.ideogram.ai/v1/ideogram-v3/generate"
+
+# Retry policy for rate-limited (429) and server-side (5xx) failures
+BASE = 0.5
+CAP = 30
+MAX_RETRIES = 5
+
+# AIMD concurrency control: grow the in-flight window while latency stays
+# under target, halve it on 429/502/503/504 or timeouts
+C_MIN = 1
+C_MAX = 16
+ALPHA = 0.5
+BETA = 0.5
+L_TARGET = 20
+CONGESTION_STATUSES = (429, 502, 503, 504)
+
+# Pause dispatch when the provider reports this few requests left in the window
+RATE_LIMIT_MIN_REMAINING = 2
+RATE_LIMIT_MIN_FRACTION = 0.1
+
+
+def _part_path(file_path):
+    """Unique temp path beside file_path; opened with plain open() so the umask applies"""
+    return file_path.with_name(f"{file_path.name}.{uuid.uuid4().hex}.part")
+
+
+@dataclass(slots=True)
+class ThumbnailResult:
+    """Outcome of generating one thumbnail in a batch"""
+    topic: str
+    file_path: Optional[str] = None
+    error: Optional[str] = None
+    success: bool = False
+
+
+class AIMDLimiter:
+    """Adaptive in-flight request limit using additive increase / multiplicative decrease"""
+    
+    __slots__ = ('c_max', 'c', 'active', 'condition')
+    
+    def __init__(self, initial, c_max=C_MAX):
+        self.c_max = c_max
+        self.c = float(min(max(C_MIN, initial), c_max))
+        self.active = 0
+        self.condition = threading.Condition()
+    
+    def acquire(self):
+        """Block until fewer than the current limit of requests are in flight"""
+        with self.condition:
+            while self.active >= int(self.c):
+                self.condition.wait()
+            self.active += 1
+    
+    def release(self, latency=None, congested=False):
+        """Free a slot and adjust the limit from the outcome of the request"""
+        with self.condition:
+            self.active -= 1
+            if congested:
+                self.c = max(C_MIN, self.c * BETA)
+            elif latency is not None and latency <= L_TARGET:
+                self.c = min(self.c_max, self.c + ALPHA)
+            self.condition.notify_all()
+
+
+class ThumbnailGenerator:
+    __slots__ = (
+        'api_key', 'output_dir', 'concurrency', 'c_max', 'limiter',
+        '_rl_lock', '_rl_remaining', '_rl_limit', '_rl_reset_ts', '_rl_paused_until',
+        'session', 'api_headers', 'cache_lock', 'cache_path', 'cache',
+    )
+    
+    def __init__(self):
+        self.api_key = os.getenv('IDEOGRAM_API_KEY')
+        self.output_dir = os.getenv('OUTPUT_DIR', './thumbnails')
+        self.concurrency = max(1, int(os.getenv('IDEOGRAM_CONCURRENCY', '4')))
+        # IDEOGRAM_CONCURRENCY is the starting window; AIMD may grow it up to c_max
+        self.c_max = max(C_MAX, self.concurrency)
+        self.limiter = AIMDLimiter(self.concurrency, self.c_max)
+        
+        # Last quota reported by the API's rate-limit headers
+        self._rl_lock = threading.Lock()
+        self._rl_remaining = None
+        self._rl_limit = None
+        self._rl_reset_ts = None
+        self._rl_paused_until = None
+        
+        if not self.api_key:
+            raise ValueError('IDEOGRAM_API_KEY is required. Please set it in your .env file.')
         
-        return random.choice(style_variations)
+        # One pooled, keep-alive session for both the API and the image CDN
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=self.c_max,
+            max_retries=0
+        )
+        self.session.mount('https://', adapter)
+        # Sent only to the Ideogram API, never to the image host
+        self.api_headers = {
+            "api-key": self.api_key,
+            "Content-Type": "application/json"
+        }
+        
+        self.ensure_output_dir()
+        
+        self.cache_lock = threading.Lock()
+        self.cache_path = Path(self.output_dir) / CACHE_MANIFEST
+        self.cache = self.load_cache()
+    
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def ensure_output_dir(self):
+        """Ensure the output directory exists"""
+        try:
+            Path(self.output_dir).mkdir(parents=True, exist_ok=True)
+            logger.info("Output directory ensured: %s", self.output_dir)
+        except Exception as error:
+            logger.error("Error creating output directory: %s", error)
+    
+    def load_cache(self):
+        """Load the manifest of previously generated thumbnails"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+    
+    def cache_key(self, topic, hook_text, aspect_ratio):
+        """Key a thumbnail by everything that determines its content"""
+        raw = f"{topic}|{hook_text}|{aspect_ratio}|{PROMPT_VERSION}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+    
+    def thumbnail_path(self, topic, aspect_ratio):
+        """Output path for a topic; non-default aspect ratios get their own file"""
+        file_name = self.sanitize_filename(topic)
+        if aspect_ratio != DEFAULT_ASPECT_RATIO:
+            file_name = f"{file_name}-{aspect_ratio}"
+        return Path(self.output_dir) / f"{file_name}.png"
+    
+    def get_cached(self, key):
+        """Return the cached file path for a key if it is still fresh and on disk"""
+        with self.cache_lock:
+            entry = self.cache.get(key)
+        if not entry:
+            return None
+        if time.time() - entry.get('created', 0) > CACHE_MAX_AGE:
+            return None
+        file_path = Path(entry['file_path'])
+        if not file_path.exists() or file_path.stat().st_size == 0:
+            return None
+        return entry['file_path']
+    
+    def adopt_existing(self, key, file_path):
+        """Record a non-empty PNG the manifest doesn't know about (older runs, lost manifest) under key"""
+        with self.cache_lock:
+            # A path the manifest tracks under another key is stale, not unknown
+            if any(entry['file_path'] == str(file_path) for entry in self.cache.values()):
+                return False
+        if not file_path.exists() or file_path.stat().st_size == 0:
+            return False
+        self.set_cached(key, file_path)
+        return True
+    
+    def set_cached(self, key, file_path):
+        """Record a generated thumbnail and atomically rewrite the manifest on disk"""
+        file_path = str(file_path)
+        with self.cache_lock:
+            # A path holds one image; drop entries for whatever it held before
+            for other in [k for k, v in self.cache.items() if v['file_path'] == file_path]:
+                del self.cache[other]
+            self.cache[key] = {'file_path': file_path, 'created': time.time()}
+            # Write a temp file and rename it over the manifest so a crash
+            # mid-write can't leave a truncated .cache.json behind
+            tmp_path = _part_path(self.cache_path)
+            try:
+                with open(tmp_path, 'x', encoding='utf-8') as file:
+                    json.dump(self.cache, file, indent=2)
+                os.replace(tmp_path, self.cache_path)
+            except OSError as error:
+                logger.error("Error writing cache manifest: %s", error)
+                tmp_path.unlink(missing_ok=True)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def generate_hook_text(topic: str) -> str:
+        """Create a short 2-4 word hook from the topic; uppercase for strong impact"""
+        text = topic
+        # Remove common words and numbers
+        text = _FILLER_RE.sub('', text)
+        # Remove any numbers at the beginning
+        text = _LEAD_NUM_RE.sub('', text)
+        text = _WS_RE.sub(' ', text).strip()
+        if not text:
+            text = topic
+        words = text.split()
+        if len(words) <= 2:
+            hook = f"Master {text}".strip()
+        else:
+            hook = ' '.join(words[:3])
+        return hook.upper()
+    
+    def generate_prompt(self, topic, hook_text):
+        """Create a clean thumbnail prompt; the style variant is stable per topic"""
+        idx = zlib.crc32(f"{topic}|{hook_text}".encode('utf-8')) % len(_PROMPT_TEMPLATES)
+        return _PROMPT_TEMPLATES[idx].format(topic=topic, hook_text=hook_text)
 
     def generate_thumbnail(self, topic, options=None):
         """Generate a single thumbnail for a course topic"""
@@ -128,108 +325,236 @@ Focus: Clear communication of the course topic through text and professional ima
             options = {}
         
         try:
-            print(f"Generating thumbnail for: {topic}")
+            logger.info("Generating thumbnail for: %s", topic)
+            overwrite = options.get("overwrite", False)
+            aspect_ratio = options.get("aspect_ratio", DEFAULT_ASPECT_RATIO)
+            file_path = self.thumbnail_path(topic, aspect_ratio)
             hook_text = self.generate_hook_text(topic)
-            prompt = self.generate_prompt(topic, hook_text)
-            aspect_ratio = options.get("aspect_ratio", "16x9")
             
-            print('Sending request to Ideogram API...')
+            # An existing file is reused only if the manifest says it was made
+            # for this key, so prompt/ratio changes and expiry still apply
+            key = self.cache_key(topic, hook_text, aspect_ratio)
+            cached_path = None if overwrite else self.get_cached(key)
+            if cached_path:
+                logger.info("Using cached thumbnail: %s", cached_path)
+                return cached_path
+            if not overwrite and self.adopt_existing(key, file_path):
+                logger.info("Using existing thumbnail: %s", file_path)
+                return str(file_path)
             
-            headers = {
-                "api-key": self.api_key,
-                "Content-Type": "application/json"
-            }
+            prompt = self.generate_prompt(topic, hook_text)
+            
+            logger.info('Sending request to Ideogram API...')
             
             data = {
                 "prompt": prompt,
-                "negative_prompt": (
-                    "logos, company logos, YouTube logo, Google logo, "
-                    "Microsoft logo, Apple logo, Meta logo, LinkedIn logo, Twitter logo, "
-                    "social media icons, badges, timestamps, watermarks, UI elements, overlays, fake text"
-                ),
+                "negative_prompt": _NEGATIVE,
                 "rendering_speed": "TURBO",
                 "aspect_ratio": aspect_ratio,
                 "quality": "standard"
             }
             
-            response = requests.post(
-                "https://api.ideogram.ai/v1/ideogram-v3/generate",
-                headers=headers,
-                json=data,
-                timeout=30
-            )
+            response = self.post_generate_request(data)
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if data and 'data' in data and len(data['data']) > 0:
                     image_url = data['data'][0]['url']
-                    print('Thumbnail generated successfully!')
-                    
-                    file_name = self.sanitize_filename(topic)
-                    file_path = Path(self.output_dir) / f"{file_name}.png"
+                    logger.info('Thumbnail generated successfully!')
                     
                     self.download_and_save_image(image_url, file_path)
+                    self.set_cached(key, file_path)
                     
-                    print(f"Thumbnail saved to: {file_path}")
+                    logger.info("Thumbnail saved to: %s", file_path)
                     return str(file_path)
                 else:
                     raise ValueError('No image data received from API')
             else:
-                print(f"API Error: {response.status_code}")
-                print(f"Response: {response.text}")
+                logger.error("API Error: %s", response.status_code)
+                logger.error("Response: %s", response.text)
                 raise ValueError(f"API request failed with status {response.status_code}")
                 
         except Exception as error:
-            print(f'Error generating thumbnail: {error}')
+            logger.error('Error generating thumbnail: %s', error)
             raise error
     
-    def sanitize_filename(self, topic):
+    def post_generate_request(self, data):
+        """POST to the generate endpoint, retrying 429/5xx with exponential backoff and full jitter"""
+        # Serialize once; every retry resends the same bytes
+        body = orjson.dumps(data)
+        for attempt in range(MAX_RETRIES):
+            self.wait_for_rate_limit()
+            self.limiter.acquire()
+            start = time.perf_counter()
+            try:
+                response = self.session.post(
+                    IDEOGRAM_GENERATE_URL,
+                    headers=self.api_headers,
+                    data=body,
+                    timeout=30
+                )
+            except requests.Timeout:
+                self.limiter.release(congested=True)
+                raise
+            except Exception:
+                self.limiter.release()
+                raise
+            
+            self.update_rate_limit(response.headers)
+            status = response.status_code
+            if status == 200:
+                self.limiter.release(latency=time.perf_counter() - start)
+            else:
+                self.limiter.release(congested=status in CONGESTION_STATUSES)
+            
+            if status != 429 and status < 500:
+                return response
+            if attempt == MAX_RETRIES - 1:
+                break
+            
+            delay = random.uniform(0, min(CAP, BASE * 2 ** attempt))
+            if status == 429:
+                # Prefer the server's hint when it gives one in seconds,
+                # bounded so a bad value can't crash or stall a worker
+                try:
+                    delay = min(CAP, max(0.0, float(response.headers.get("Retry-After", delay))))
+                except ValueError:
+                    pass
+            logger.warning(
+                "API returned %s, retrying in %.1fs (%d/%d)", status, delay, attempt + 1, MAX_RETRIES - 1
+            )
+            time.sleep(delay)
+        
+        return response
+    
+    def update_rate_limit(self, headers):
+        """Record the quota from rate-limit response headers and pause dispatch if it is nearly exhausted"""
+        remaining = headers.get("x-ratelimit-remaining-requests")
+        limit = headers.get("x-ratelimit-limit-requests")
+        reset = headers.get("x-ratelimit-reset") or headers.get("retry-after")
+        if remaining is None and reset is None:
+            return
+        
+        with self._rl_lock:
+            try:
+                if remaining is not None:
+                    self._rl_remaining = int(remaining)
+                if limit is not None:
+                    self._rl_limit = int(limit)
+                if reset is not None:
+                    reset = float(reset)
+                    # Large values are epoch timestamps (seconds or milliseconds),
+                    # small ones are seconds from now
+                    if reset > 1e12:
+                        reset /= 1000
+                    now = time.time()
+                    reset_ts = reset if reset > 1e9 else now + reset
+                    # Never pause longer than the backoff cap, whatever the header says
+                    self._rl_reset_ts = min(max(now, reset_ts), now + CAP)
+            except (ValueError, OverflowError):
+                return
+            
+            if self._rl_remaining is None or self._rl_reset_ts is None:
+                return
+            threshold = RATE_LIMIT_MIN_REMAINING
+            if self._rl_limit:
+                threshold = max(threshold, self._rl_limit * RATE_LIMIT_MIN_FRACTION)
+            
+            # Fresh numbers decide the pause: set it while the quota is low,
+            # lift it as soon as a response reports quota available again
+            if self._rl_remaining <= threshold and self._rl_reset_ts > time.time():
+                if self._rl_paused_until is None:
+                    logger.warning(
+                        "Rate limit nearly exhausted (%s left), pausing %.1fs",
+                        self._rl_remaining, self._rl_reset_ts - time.time()
+                    )
+                self._rl_paused_until = self._rl_reset_ts
+            else:
+                self._rl_paused_until = None
+    
+    def wait_for_rate_limit(self):
+        """Block every worker until a rate-limit pause set by update_rate_limit has passed"""
+        while True:
+            with self._rl_lock:
+                paused_until = self._rl_paused_until
+                if paused_until is None:
+                    return
+                delay = paused_until - time.time()
+                if delay <= 0:
+                    # Only clear the pause once its time is up
+                    if self._rl_paused_until == paused_until:
+                        self._rl_paused_until = None
+                    return
+            time.sleep(delay)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def sanitize_filename(topic):
         """Sanitize the topic name for use as a filename"""
-        sanitized = re.sub(r'[^a-zA-Z0-9\s-]', '', topic.lower())
-        sanitized = re.sub(r'\s+', '-', sanitized)
+        sanitized = _SANITIZE_RE.sub('', topic.lower())
+        sanitized = _WS_RE.sub('-', sanitized)
         return sanitized[:50]
     
     def download_and_save_image(self, image_url, file_path):
         """Download and save the image from URL"""
         try:
-            response = requests.get(image_url, stream=True)
-            response.raise_for_status()
-            
-            with open(file_path, 'wb') as file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    file.write(chunk)
+            file_path = Path(file_path)
+            # Write to a uniquely named file beside the target and rename it
+            # into place, so an interrupted download never leaves a partial PNG
+            # and workers whose topics truncate to the same name can't share one
+            tmp_path = _part_path(file_path)
+            try:
+                with self.session.get(image_url, stream=True, timeout=30) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    
+                    with open(tmp_path, 'xb') as file:
+                        shutil.copyfileobj(response.raw, file, length=1024 * 1024)
+                os.replace(tmp_path, file_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
             
-            print(f"Image downloaded and saved to: {file_path}")
+            logger.info("Image downloaded and saved to: %s", file_path)
         except Exception as error:
-            print(f'Error downloading image: {error}')
+            logger.error('Error downloading image: %s', error)
             raise error
     
+    def safe_generate_thumbnail(self, topic, options=None):
+        """Generate a thumbnail, reporting failure in the result instead of raising"""
+        try:
+            file_path = self.generate_thumbnail(topic, options)
+            return ThumbnailResult(topic, file_path=file_path, success=True)
+        except Exception as error:
+            logger.error('Failed to generate thumbnail for "%s": %s', topic, error)
+            return ThumbnailResult(topic, error=str(error))
+    
     def generate_multiple_thumbnails(self, topics, options=None):
         """Generate thumbnails for multiple course topics with variety"""
         if options is None:
             options = {}
         
-        results = []
-        import random
-        
         # Different aspect ratios for variety
         aspect_ratios = ["16x9", "16x9", "16x9", "16x9", "16x9"]  # Mostly 16x9 but can add others
         
+        jobs = []
         for i, topic in enumerate(topics):
-            try:
-                # Add some variety to options
-                current_options = options.copy()
-                if i % 3 == 0:  # Every 3rd thumbnail gets different styling
-                    current_options["aspect_ratio"] = random.choice(aspect_ratios)
-                
-                file_path = self.generate_thumbnail(topic, current_options)
-                results.append({'topic': topic, 'file_path': file_path, 'success': True})
-            except Exception as error:
-                print(f'Failed to generate thumbnail for "{topic}": {error}')
-                results.append({'topic': topic, 'error': str(error), 'success': False})
-            
-            # Random delay between 1-3 seconds to avoid rate limiting
-            time.sleep(random.uniform(1, 3))
+            # Add some variety to options
+            current_options = options.copy()
+            if i % 3 == 0:  # Every 3rd thumbnail gets different styling
+                current_options["aspect_ratio"] = random.choice(aspect_ratios)
+            jobs.append((topic, current_options))
+        
+        # Requests are network-bound, so keep several in flight at once;
+        # the AIMD limiter decides how many of the workers may hit the API
+        results = [None] * len(jobs)
+        max_workers = max(1, min(self.c_max, len(jobs)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.safe_generate_thumbnail, topic, current_options): index
+                for index, (topic, current_options) in enumerate(jobs)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
         
         return results
 
@@ -251,21 +576,22 @@ def main():
 
 ]
         
-        print('🚀 Starting thumbnail generation...\n')
+        logger.info('🚀 Starting thumbnail generation...\n')
         
-        results = generator.generate_multiple_thumbnails(course_topics, {
-            "aspect_ratio": "16x9"
-        })
+        with generator:
+            results = generator.generate_multiple_thumbnails(course_topics, {
+                "aspect_ratio": "16x9"
+            })
         
-        print('\n📊 Generation Results:')
+        logger.info('\n📊 Generation Results:')
         for result in results:
-            if result['success']:
-                print(f"✅ {result['topic']}: {result['file_path']}")
+            if result.success:
+                logger.info("✅ %s: %s", result.topic, result.file_path)
             else:
-                print(f"❌ {result['topic']}: {result['error']}")
+                logger.info("❌ %s: %s", result.topic, result.error)
         
     except Exception as error:
-        print(f'❌ Script failed: {error}')
+        logger.error('❌ Script failed: %s', error)
         exit(1)
 
 